@@ -0,0 +1,58 @@
+from enum import Enum as PyEnum
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Enum for Item status
+class StatusEnum(PyEnum):
+    NEW = "NEW"
+    APPROVED = "APPROVED"
+    EOL = "EOL"
+
+
+# Schemas for request and response validation
+class ItemCreate(BaseModel):
+    title: str = Field(max_length=255)  # Matches the VARCHAR(255) column
+    status: StatusEnum
+    description: Optional[str] = Field(default=None, max_length=255)  # Matches the VARCHAR(255) column
+    id: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ItemListOut(BaseModel):
+    id: int
+    title: str
+    status: StatusEnum
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserCreate(BaseModel):
+    email: Optional[str] = None
+    password: Optional[str] = None
+    id: Optional[int] = None
+    is_active: Optional[bool] = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserOut(BaseModel):
+    id: int
+    email: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserWithItems(BaseModel):
+    id: int
+    email: Optional[str] = None
+    is_active: Optional[bool] = True
+    items: List[ItemCreate] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StatusUpdate(BaseModel):
+    status: StatusEnum  # Schema for updating status